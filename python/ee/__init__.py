@@ -8,70 +8,168 @@ __version__ = '0.1.173'
 # pylint: disable=g-bad-name
 
 # pylint: disable=g-bad-import-order
-import collections
-import datetime
+import functools
+import importlib
 import inspect
-import numbers
-import os
+import sys
+import threading
 import six
 
-from . import batch
-from . import data
-from . import deserializer
-from . import ee_types as types
-from ._helpers import _GetPersistentCredentials
-
-# Public re-exports.
-from ._helpers import ServiceAccountCredentials
-from ._helpers import apply  # pylint: disable=redefined-builtin
-from ._helpers import call
-from ._helpers import profilePrinting
-from .apifunction import ApiFunction
-from .collection import Collection
+# These are needed at module-definition time: ComputedObject is the base class
+# of the classes built by _MakeClass, Function is needed to register _Promote,
+# and EEException is raised directly from this module. Everything else is
+# imported lazily on first attribute access via the module-level __getattr__
+# below (PEP 562), so "import ee" doesn't pay for submodules it never uses.
 from .computedobject import ComputedObject
-from .customfunction import CustomFunction
-from .dictionary import Dictionary
-from .ee_date import Date
 from .ee_exception import EEException
-from .ee_list import List
-from .ee_number import Number
-from .ee_string import String
-from .element import Element
-from .encodable import Encodable
-from .feature import Feature
-from .featurecollection import FeatureCollection
-from .filter import Filter
 from .function import Function
-from .geometry import Geometry
-from .image import Image
-from .imagecollection import ImageCollection
-from .serializer import Serializer
-from .terrain import Terrain
+
+# Maps the name of each lazily-imported attribute to the submodule that
+# provides it, and the name of the attribute within that submodule (or None if
+# the export is the submodule itself).
+_LAZY_IMPORTS = {
+    'batch': ('batch', None),
+    'data': ('data', None),
+    'deserializer': ('deserializer', None),
+    'types': ('ee_types', None),
+    '_GetPersistentCredentials': ('_helpers', '_GetPersistentCredentials'),
+    # Public re-exports.
+    'ServiceAccountCredentials': ('_helpers', 'ServiceAccountCredentials'),
+    'apply': ('_helpers', 'apply'),
+    'call': ('_helpers', 'call'),
+    'profilePrinting': ('_helpers', 'profilePrinting'),
+    'ApiFunction': ('apifunction', 'ApiFunction'),
+    'Collection': ('collection', 'Collection'),
+    'CustomFunction': ('customfunction', 'CustomFunction'),
+    'Dictionary': ('dictionary', 'Dictionary'),
+    'Date': ('ee_date', 'Date'),
+    'List': ('ee_list', 'List'),
+    'Number': ('ee_number', 'Number'),
+    'String': ('ee_string', 'String'),
+    'Element': ('element', 'Element'),
+    'Encodable': ('encodable', 'Encodable'),
+    'Feature': ('feature', 'Feature'),
+    'FeatureCollection': ('featurecollection', 'FeatureCollection'),
+    'Filter': ('filter', 'Filter'),
+    'Geometry': ('geometry', 'Geometry'),
+    'Image': ('image', 'Image'),
+    'ImageCollection': ('imagecollection', 'ImageCollection'),
+    'Serializer': ('serializer', 'Serializer'),
+    'Terrain': ('terrain', 'Terrain'),
+}
+
+# Whether _LoadLazyImports has run.
+_lazyImportsLoaded = False
+
+# The module's own __dict__, bound once: globals() always returns the same
+# dict object, so hot paths like _Promote can probe it without re-calling the
+# builtin.
+_G = globals()
+
+
+def __getattr__(name):
+  """Imports a lazily-loaded attribute on first access. See PEP 562."""
+  try:
+    module_name, attr_name = _LAZY_IMPORTS[name]
+  except KeyError:
+    # The name may be a dynamically generated class whose construction
+    # Initialize() deferred.
+    if _deferred_api_pending:
+      _EnsureDeferredApiBuilt()
+      if name in globals():
+        return globals()[name]
+    raise AttributeError(
+        'module %r has no attribute %r' % (__name__, name))
+  module = importlib.import_module('.' + module_name, __name__)
+  value = module if attr_name is None else getattr(module, attr_name)
+  # Cache the result so subsequent accesses skip this function.
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+def _LoadLazyImports():
+  """Forces all lazy imports to resolve and binds them as module globals.
+
+  Initialize() and _Promote() need most of the lazily-imported classes anyway,
+  so they call this once rather than routing every reference through
+  __getattr__. Calls __getattr__ directly rather than through the module
+  attribute protocol, which only honors it on Python 3.7+ (PEP 562).
+  """
+  global _lazyImportsLoaded, _PROMOTERS
+  if not _lazyImportsLoaded:
+    for name in _LAZY_IMPORTS:
+      if name not in _G:
+        __getattr__(name)
+    _lazyImportsLoaded = True
+    _PROMOTERS = _BuildPromoters()
 
 # A list of autogenerated class names added by _InitializeGenerateClasses.
 _generatedClasses = []
 
+# Whether Initialize() has deferred building the generated classes and the
+# ee.Algorithms tree until their first use. Both iterate every signature, and
+# most sessions touch only a handful of algorithms.
+_deferred_api_pending = False
+
+# Guards the one-shot deferred build.
+_init_lock = threading.Lock()
+
+
+def _EnsureDeferredApiBuilt():
+  """Builds the generated classes and ee.Algorithms if Initialize deferred it."""
+  global _deferred_api_pending
+  if _deferred_api_pending:
+    with _init_lock:
+      if _deferred_api_pending:
+        _InitializeGeneratedClasses()
+        _InitializeUnboundMethods()
+        # Cleared only after the build completes, so a second thread arriving
+        # during the build blocks on the lock above rather than proceeding
+        # against a half-built state.
+        _deferred_api_pending = False
+
 
 class _AlgorithmsContainer(dict):
   """A lightweight class that is used as a dictionary with dot notation.
   """
 
-  def __getattr__(self, name):
-    try:
-      return self[name]
-    except KeyError:
-      raise AttributeError
+  def __init__(self, *args, **kwargs):
+    super(_AlgorithmsContainer, self).__init__(*args, **kwargs)
+    # Alias the instance __dict__ to the dict itself, so attribute access
+    # resolves through the ordinary C-level instance-dict lookup instead of
+    # Python-level __getattr__/__setattr__ overrides.
+    self.__dict__ = self
 
-  def __setattr__(self, name, value):
-    self[name] = value
-
-  def __delattr__(self, name):
-    del self[name]
+  def __getattr__(self, name):
+    # Only reached when the dict lookup misses. If Initialize() deferred
+    # building the algorithms tree, build it now and retry.
+    if _deferred_api_pending:
+      _EnsureDeferredApiBuilt()
+      try:
+        return self[name]
+      except KeyError:
+        pass
+    raise AttributeError(name)
 
 # A dictionary of algorithms that are not bound to a specific class.
 Algorithms = _AlgorithmsContainer()
 
 
+class _BoundAlgorithm(functools.partial):
+  """A callable that binds an ApiFunction's call method.
+
+  Invoking a partial forwards to the underlying bound method at C level,
+  without the extra Python frame and argument repacking a lambda wrapper
+  costs, and unlike the C partial type itself, the subclass can carry
+  attributes: the signature, the docstring, and any child algorithms attached
+  to it (e.g. ee.Algorithms.Foo.bar when Foo is itself an algorithm).
+  """
+
+
 def Initialize(
     credentials='persistent',
     opt_url=None,
@@ -92,6 +190,7 @@ def Initialize(
     use_cloud_api: Whether the Cloud API should be used.
     cloud_api_key: An optional API key to use the Cloud API.
   """
+  _LoadLazyImports()
   if credentials == 'persistent':
     credentials = _GetPersistentCredentials()
   data.initialize(
@@ -117,12 +216,29 @@ def Initialize(
   Date.initialize()
   Dictionary.initialize()
   Terrain.initialize()
-  _InitializeGeneratedClasses()
-  _InitializeUnboundMethods()
+  # Building the generated classes and the ee.Algorithms tree iterates every
+  # signature, so defer both until something actually uses them. First access
+  # through the module, ee.Algorithms, _Promote, or a types.nameToClass miss
+  # triggers the build.
+  global _deferred_api_pending
+  _deferred_api_pending = True
+  # Register the static classes right away: the registry holds this module's
+  # dict by reference, so classes generated later appear automatically.
+  # pylint: disable=protected-access
+  types._registerClasses(globals())
+  types._registerClassBuilder(_EnsureDeferredApiBuilt)
+  # pylint: enable=protected-access
+  # Without PEP 562 module __getattr__ (Python 3.7+), deferred classes would
+  # be unreachable as module attributes, so build them right away.
+  if sys.version_info < (3, 7):
+    _EnsureDeferredApiBuilt()
 
 
 def Reset():
   """Reset the library. Useful for re-initializing to a different server."""
+  _LoadLazyImports()
+  from . import _helpers  # pylint: disable=g-import-not-at-top
+  _helpers._ClearLookupCache()  # pylint: disable=protected-access
   data.reset()
   ApiFunction.reset()
   Element.reset()
@@ -140,8 +256,9 @@ def Reset():
   Dictionary.reset()
   Terrain.reset()
   _ResetGeneratedClasses()
-  global Algorithms
+  global Algorithms, _deferred_api_pending
   Algorithms = _AlgorithmsContainer()
+  _deferred_api_pending = False
 
 
 def _ResetGeneratedClasses():
@@ -149,14 +266,135 @@ def _ResetGeneratedClasses():
   global _generatedClasses
 
   for name in _generatedClasses:
-    ApiFunction.clearApi(globals()[name])
-    del globals()[name]
+    # pop combines the lookup and the deletion into one dict operation, and
+    # tolerates a partially cleaned-up module dict.
+    cls = _G.pop(name, None)
+    if cls is not None:
+      ApiFunction.clearApi(cls)
   _generatedClasses = []
   # Warning: we're passing all of globals() into registerClasses.
   # This is a) pass by reference, and b) a lot more stuff.
   types._registerClasses(globals())     # pylint: disable=protected-access
 
 
+def _PromoteFeature(arg):
+  """Promotes an argument to a Feature."""
+  if isinstance(arg, Collection):
+    # TODO(user): Decide whether we want to leave this in. It can be
+    #              quite dangerous on large collections.
+    return ApiFunction.call_(
+        'Feature', ApiFunction.call_('Collection.geometry', arg))
+  else:
+    return Feature(arg)
+
+
+def _PromoteElement(arg):
+  """Promotes an argument to an Element."""
+  if isinstance(arg, Element):
+    # Already an Element.
+    return arg
+  elif isinstance(arg, Geometry):
+    # Geometries get promoted to Features.
+    return Feature(arg)
+  elif isinstance(arg, ComputedObject):
+    # Try a cast.
+    return Element(arg.func, arg.args, arg.varName)
+  else:
+    # No way to convert.
+    raise EEException('Cannot convert %s to Element.' % arg)
+
+
+def _PromoteGeometry(arg):
+  """Promotes an argument to a Geometry."""
+  if isinstance(arg, Collection):
+    return ApiFunction.call_('Collection.geometry', arg)
+  else:
+    return Geometry(arg)
+
+
+def _PromoteFeatureCollection(arg):
+  """Promotes an argument to a FeatureCollection."""
+  if isinstance(arg, Collection):
+    return arg
+  else:
+    return FeatureCollection(arg)
+
+
+def _PromoteAlgorithm(arg):
+  """Promotes an argument to an Algorithm."""
+  if isinstance(arg, six.string_types):
+    # An API function name.
+    return ApiFunction.lookup(arg)
+  elif callable(arg):
+    # A native function that needs to be wrapped.
+    args_count = len(inspect.getargspec(arg).args)
+    return CustomFunction.create(arg, 'Object', ['Object'] * args_count)
+  elif isinstance(arg, Encodable):
+    # An ee.Function or a computed function like the return value of
+    # Image.parseExpression().
+    return arg
+  else:
+    raise EEException('Argument is not a function: %s' % arg)
+
+
+def _PromoteDictionary(arg):
+  """Promotes an argument to a Dictionary."""
+  if isinstance(arg, dict):
+    return arg
+  else:
+    return Dictionary(arg)
+
+
+# The types that the 'String' promoter wraps in an ee.String: primitive
+# strings and any ComputedObject. This is exactly what the old chain of
+# types.isString/isinstance checks accepted (String is itself a
+# ComputedObject, and an ee.String self-cast is a no-op), collapsed into a
+# single isinstance tuple.
+_PROMOTABLE_STRING_TYPES = six.string_types + (ComputedObject,)
+
+
+def _PromoteString(arg):
+  """Promotes an argument to a String."""
+  if isinstance(arg, _PROMOTABLE_STRING_TYPES):
+    return String(arg)
+  else:
+    return arg
+
+
+def _BuildPromoters():
+  """Builds the type name to handler dispatch table used by _Promote.
+
+  Must not run until the lazily-imported classes have been loaded; handlers
+  whose promotion is a plain constructor call are the classes themselves.
+
+  Returns:
+    A dictionary mapping type names to one-argument promotion handlers.
+  """
+  promoters = {
+      'Image': Image,
+      'Feature': _PromoteFeature,
+      'Element': _PromoteElement,
+      'Geometry': _PromoteGeometry,
+      # For now Collection is synonymous with FeatureCollection.
+      'FeatureCollection': _PromoteFeatureCollection,
+      'Collection': _PromoteFeatureCollection,
+      'ImageCollection': ImageCollection,
+      'Filter': Filter,
+      'Algorithm': _PromoteAlgorithm,
+      'Dictionary': _PromoteDictionary,
+      'String': _PromoteString,
+      'List': List,
+  }
+  for name in ('Number', 'Float', 'Long', 'Integer', 'Short', 'Byte'):
+    promoters[name] = Number
+  return promoters
+
+
+# The dispatch table used by _Promote, mapping type names to handlers.
+# Populated by _LoadLazyImports once the promoted classes exist.
+_PROMOTERS = None
+
+
 def _Promote(arg, klass):
   """Wrap an argument in an object of the specified class.
 
@@ -174,127 +412,73 @@ def _Promote(arg, klass):
   if arg is None:
     return arg
 
-  if klass == 'Image':
-    return Image(arg)
-  elif klass == 'Feature':
-    if isinstance(arg, Collection):
-      # TODO(user): Decide whether we want to leave this in. It can be
-      #              quite dangerous on large collections.
-      return ApiFunction.call_(
-          'Feature', ApiFunction.call_('Collection.geometry', arg))
-    else:
-      return Feature(arg)
-  elif klass == 'Element':
-    if isinstance(arg, Element):
-      # Already an Element.
-      return arg
-    elif isinstance(arg, Geometry):
-      # Geometries get promoted to Features.
-      return Feature(arg)
-    elif isinstance(arg, ComputedObject):
-      # Try a cast.
-      return Element(arg.func, arg.args, arg.varName)
-    else:
-      # No way to convert.
-      raise EEException('Cannot convert %s to Element.' % arg)
-  elif klass == 'Geometry':
-    if isinstance(arg, Collection):
-      return ApiFunction.call_('Collection.geometry', arg)
-    else:
-      return Geometry(arg)
-  elif klass in ('FeatureCollection', 'Collection'):
-    # For now Collection is synonymous with FeatureCollection.
-    if isinstance(arg, Collection):
-      return arg
-    else:
-      return FeatureCollection(arg)
-  elif klass == 'ImageCollection':
-    return ImageCollection(arg)
-  elif klass == 'Filter':
-    return Filter(arg)
-  elif klass == 'Algorithm':
-    if isinstance(arg, six.string_types):
-      # An API function name.
-      return ApiFunction.lookup(arg)
-    elif callable(arg):
-      # A native function that needs to be wrapped.
-      args_count = len(inspect.getargspec(arg).args)
-      return CustomFunction.create(arg, 'Object', ['Object'] * args_count)
-    elif isinstance(arg, Encodable):
-      # An ee.Function or a computed function like the return value of
-      # Image.parseExpression().
-      return arg
-    else:
-      raise EEException('Argument is not a function: %s' % arg)
-  elif klass == 'Dictionary':
-    if isinstance(arg, dict):
-      return arg
-    else:
-      return Dictionary(arg)
-  elif klass == 'String':
-    if (types.isString(arg) or
-        isinstance(arg, ComputedObject) or
-        isinstance(arg, String)):
-      return String(arg)
-    else:
+  promoters = _PROMOTERS
+  if promoters is None:
+    _LoadLazyImports()
+    promoters = _PROMOTERS
+
+  handler = promoters.get(klass)
+  if handler is not None:
+    return handler(arg)
+
+  cls = _G.get(klass)
+  if cls is None:
+    if not _deferred_api_pending:
       return arg
-  elif klass == 'List':
-    return List(arg)
-  elif klass in ('Number', 'Float', 'Long', 'Integer', 'Short', 'Byte'):
-    return Number(arg)
-  elif klass in globals():
-    cls = globals()[klass]
-    ctor = ApiFunction.lookupInternal(klass)
-    # Handle dynamically created classes.
-    if isinstance(arg, cls):
-      # Return unchanged.
+    _EnsureDeferredApiBuilt()
+    cls = _G.get(klass)
+    if cls is None:
       return arg
-    elif ctor:
-      # The client-side constructor will call the server-side constructor.
-      return cls(arg)
-    elif isinstance(arg, six.string_types):
-      if hasattr(cls, arg):
-        # arg is the name of a method in klass.
-        return getattr(cls, arg)()
-      else:
-        raise EEException('Unknown algorithm: %s.%s' % (klass, arg))
+
+  ctor = ApiFunction.lookupInternal(klass)
+  # Handle dynamically created classes.
+  if isinstance(arg, cls):
+    # Return unchanged.
+    return arg
+  elif ctor:
+    # The client-side constructor will call the server-side constructor.
+    return cls(arg)
+  elif isinstance(arg, six.string_types):
+    if hasattr(cls, arg):
+      # arg is the name of a method in klass.
+      return getattr(cls, arg)()
     else:
-      # Client-side cast.
-      return cls(arg)
+      raise EEException('Unknown algorithm: %s.%s' % (klass, arg))
   else:
-    return arg
+    # Client-side cast.
+    return cls(arg)
 
 
 def _InitializeUnboundMethods():
-  # Sort the items by length, so parents get created before children.
-  items = sorted(
-      ApiFunction.unboundFunctions().items(), key=lambda x: len(x[0]))
-
-  for name, func in items:
+  _LoadLazyImports()
+  # No ordering is needed: intermediate containers are created on demand, and
+  # an algorithm attached after its children adopts them below.
+  for name, func in ApiFunction.unboundFunctions().items():
     signature = func.getSignature()
     if signature.get('hidden', False):
       continue
 
-    # Create nested objects as needed.
+    # Create nested objects as needed. _AlgorithmsContainer is a dict, so
+    # traverse it directly instead of through __getattr__, which raises a
+    # costly AttributeError for every missing level. A parent that is itself
+    # an algorithm is a plain function object and still needs getattr/setattr.
     name_parts = name.split('.')
     target = Algorithms
-    while len(name_parts) > 1:
-      first = name_parts[0]
-      # Set the attribute if it doesn't already exist. The try/except block
-      # works in both Python 2 & 3.
-      try:
-        getattr(target, first)
-      except AttributeError:
-        setattr(target, first, _AlgorithmsContainer())
-
-      target = getattr(target, first)
-      name_parts = name_parts[1:]
-
-    # Attach the function.
-    # We need a copy of the function to attach properties.
-    def GenerateFunction(f):
-      return lambda *args, **kwargs: f.call(*args, **kwargs)  # pylint: disable=unnecessary-lambda
-    bound = GenerateFunction(func)
+    for first in name_parts[:-1]:
+      if isinstance(target, _AlgorithmsContainer):
+        if first not in target:
+          target[first] = _AlgorithmsContainer()
+        target = target[first]
+      else:
+        try:
+          target = getattr(target, first)
+        except AttributeError:
+          child = _AlgorithmsContainer()
+          setattr(target, first, child)
+          target = child
+
+    # Attach the function, wrapped so that properties can be attached.
+    bound = _BoundAlgorithm(func.call)
     bound.signature = signature
     # Add docs. If there are non-ASCII characters in the docs, and we're in
     # Python 2, use a hammer to force them into a str.
@@ -302,21 +486,45 @@ def _InitializeUnboundMethods():
       bound.__doc__ = str(func)
     except UnicodeEncodeError:
       bound.__doc__ = func.__str__().encode('utf8')
-    setattr(target, name_parts[0], bound)
+    # If children of this algorithm were attached first, they live in a
+    # placeholder container; adopt them as attributes of the function before
+    # it replaces the placeholder.
+    leaf = name_parts[-1]
+    if isinstance(target, _AlgorithmsContainer):
+      existing = target.get(leaf)
+      if isinstance(existing, _AlgorithmsContainer):
+        bound.__dict__.update(existing)
+      target[leaf] = bound
+    else:
+      existing = getattr(target, leaf, None)
+      if isinstance(existing, _AlgorithmsContainer):
+        bound.__dict__.update(existing)
+      setattr(target, leaf, bound)
 
 
 def _InitializeGeneratedClasses():
   """Generate classes for extra types that appear in the web API."""
+  _LoadLazyImports()
   signatures = ApiFunction.allSignatures()
-  # Collect the first part of all function names.
-  names = set([name.split('.')[0] for name in signatures])
-  # Collect the return types of all functions.
-  returns = set([signatures[sig]['returns'] for sig in signatures])
-
-  want = [name for name in names.intersection(returns) if name not in globals()]
+  # Collect the first part of all function names, the return types of all
+  # functions, and the dotted names grouped by prefix, in a single pass over
+  # the signatures. The prefix index lets each generated class bind only its
+  # own functions instead of rescanning every signature.
+  names = set()
+  returns = set()
+  by_prefix = {}
+  for name, signature in signatures.items():
+    prefix, _, rest = name.partition('.')
+    names.add(prefix)
+    returns.add(signature['returns'])
+    if rest:
+      by_prefix.setdefault(prefix, []).append(name)
+
+  globals_ = globals()
+  want = [name for name in names.intersection(returns) if name not in globals_]
 
   for name in want:
-    globals()[name] = _MakeClass(name)
+    globals()[name] = _MakeClass(name, by_prefix.get(name, ()))
     _generatedClasses.append(name)
     ApiFunction._bound_signatures.add(name)  # pylint: disable=protected-access
 
@@ -325,8 +533,24 @@ def _InitializeGeneratedClasses():
   types._registerClasses(globals())     # pylint: disable=protected-access
 
 
-def _MakeClass(name):
-  """Generates a dynamic API class for a given name."""
+def _MakeClass(name, opt_func_names=None):
+  """Generates a dynamic API class for a given name.
+
+  Args:
+    name: The name of the class to generate.
+    opt_func_names: An optional iterable of the API function names to bind to
+        the class, as precomputed by _InitializeGeneratedClasses. If None, all
+        signatures are scanned for matches.
+
+  Returns:
+    The generated class.
+  """
+  # Bound once at class-build time, so each construction avoids re-resolving
+  # them: the server-side constructor for this type (if any) and the base
+  # initializer. The generated classes are rebuilt whenever the signature
+  # table is, so neither can go stale.
+  ctor = ApiFunction.lookupInternal(name)
+  co_init = ComputedObject.__init__
 
   def init(self, *args):
     """Initializer for dynamically created classes.
@@ -339,7 +563,7 @@ def _MakeClass(name):
     Returns:
       The new class.
     """
-    klass = globals()[name]
+    klass = _G[name]
     onlyOneArg = (len(args) == 1)
     # Are we trying to cast something that's already of the right class?
     if onlyOneArg and isinstance(args[0], klass):
@@ -347,7 +571,6 @@ def _MakeClass(name):
     else:
       # Decide whether to call a server-side constructor or just do a
       # client-side cast.
-      ctor = ApiFunction.lookupInternal(name)
       firstArgIsPrimitive = not isinstance(args[0], ComputedObject)
       shouldUseConstructor = False
       if ctor:
@@ -364,8 +587,7 @@ def _MakeClass(name):
       # Apply our decision.
       if shouldUseConstructor:
         # Call ctor manually to avoid having promote() called on the output.
-        ComputedObject.__init__(
-            self, ctor, ctor.promoteArgs(ctor.nameArgs(args)))
+        co_init(self, ctor, ctor.promoteArgs(ctor.nameArgs(args)))
       else:
         # Just cast and hope for the best.
         if not onlyOneArg:
@@ -379,13 +601,22 @@ def _MakeClass(name):
               (name, args))
         else:
           result = args[0]
-        ComputedObject.__init__(self, result.func, result.args, result.varName)
+        co_init(self, result.func, result.args, result.varName)
 
-  properties = {'__init__': init, 'name': lambda self: name}
+  # The generated class adds no state of its own beyond what
+  # ComputedObject.__init__ sets, so don't give it room for any. (The
+  # instances still carry the base class's __dict__, which
+  # ComputedObject.__eq__ and __hash__ rely on.)
+  properties = {'__init__': init, 'name': lambda self: name, '__slots__': ()}
   new_class = type(str(name), (ComputedObject,), properties)
-  ApiFunction.importApi(new_class, name, name)
+  ApiFunction.importApi(new_class, name, name, opt_names=opt_func_names)
   return new_class
 
 
 # Set up type promotion rules as soon the package is loaded.
 Function._registerPromoter(_Promote)   # pylint: disable=protected-access
+
+# Module-level __getattr__ is only honored on Python 3.7+ (PEP 562). Older
+# interpreters, including Python 2, keep the previous eager-import behavior.
+if sys.version_info < (3, 7):
+  _LoadLazyImports()
@@ -10,6 +10,7 @@ referenced from there (e.g. "ee.profilePrinting").
 
 import contextlib
 import json
+import os
 import sys
 # pylint: disable=g-importing-member
 from . import data
@@ -17,8 +18,6 @@ from . import oauth
 from .apifunction import ApiFunction
 from .ee_exception import EEException
 # pylint: enable=g-importing-member
-import oauth2client.client
-import oauth2client.service_account
 import six
 
 
@@ -30,6 +29,9 @@ def _GetPersistentCredentials():
   Returns:
     OAuth2Credentials built from persistently stored refresh_token
   """
+  # Imported lazily so that "import ee" doesn't pay for oauth2client unless
+  # credentials are actually constructed.
+  import oauth2client.client  # pylint: disable=g-import-not-at-top
   try:
     tokens = json.load(open(oauth.get_credentials_path()))
     refresh_token = tokens['refresh_token']
@@ -42,6 +44,30 @@ def _GetPersistentCredentials():
                       'command line, and then retry.')
 
 
+# Caches the raw contents of service account key files, keyed by path and
+# modification time so that rotated keys are picked up. Long-running servers
+# may construct credentials repeatedly; this avoids re-reading the same file.
+_keyfile_cache = {}
+
+
+def _ReadKeyFile(key_file):
+  """Reads a service account key file, returning cached bytes if unchanged."""
+  cache_key = (key_file, os.stat(key_file).st_mtime)
+  key_data = _keyfile_cache.get(cache_key)
+  if key_data is None:
+    with open(key_file, 'rb') as f:
+      key_data = f.read()
+    _keyfile_cache[cache_key] = key_data
+  return key_data
+
+
+# Caches constructed service account credentials, keyed by the account email
+# and key source. Parsing the RSA key is the expensive step and oauth2client
+# credential objects manage their own token refresh, so one object can be
+# shared across repeated calls with the same inputs.
+_credentials_cache = {}
+
+
 def ServiceAccountCredentials(email, key_file=None, key_data=None):
   """Configure OAuth2 credentials for a Google Service Account.
 
@@ -59,6 +85,19 @@ def ServiceAccountCredentials(email, key_file=None, key_data=None):
     NotImplementedError: Occurs if using oauth2client v2+ and a PEM formatted
         credentials key file.
   """
+  # When reading from a file, fold its modification time into the cache key
+  # so that a key rotated on disk invalidates the cached credentials.
+  file_version = os.stat(key_file).st_mtime if key_file else None
+  cache_key = (email, key_file, file_version, key_data)
+  credentials = _credentials_cache.get(cache_key)
+  if credentials is not None:
+    return credentials
+  # Imported lazily so that "import ee" doesn't pay for oauth2client unless
+  # credentials are actually constructed.
+  # pylint: disable=g-import-not-at-top
+  import oauth2client.client
+  import oauth2client.service_account
+  # pylint: enable=g-import-not-at-top
   try:
     # oauth2client v2+ and JSON key
     sa_creds = oauth2client.service_account.ServiceAccountCredentials
@@ -73,13 +112,32 @@ def ServiceAccountCredentials(email, key_file=None, key_data=None):
   except AttributeError:
     # oauth2client v1 (i.e. does not have a ServiceAccountCredentials)
     if key_file:
-      with open(key_file, 'rb') as key_file:
-        key_data = key_file.read()
+      key_data = _ReadKeyFile(key_file)
     credentials = oauth2client.client.SignedJwtAssertionCredentials(
         email, key_data, oauth.SCOPE)
+  _credentials_cache[cache_key] = credentials
   return credentials
 
 
+# Caches the ApiFunction resolved for each name passed to call() or apply(),
+# so repeated invocations of the same API skip the lookup. Cleared by
+# ee.Reset() since a re-Initialize may point at a different server.
+_lookup_cache = {}
+
+
+def _ClearLookupCache():
+  """Clears the cached name to ApiFunction resolutions."""
+  _lookup_cache.clear()
+
+
+def _Lookup(name):
+  """Looks up an API function by name, caching the result."""
+  func = _lookup_cache.get(name)
+  if func is None:
+    func = _lookup_cache[name] = ApiFunction.lookup(name)
+  return func
+
+
 def call(func, *args, **kwargs):
   """Invoke the given algorithm with the specified args.
 
@@ -95,7 +153,7 @@ def call(func, *args, **kwargs):
     to that type.
   """
   if isinstance(func, six.string_types):
-    func = ApiFunction.lookup(func)
+    func = _Lookup(func)
   return func.call(*args, **kwargs)
 
 
@@ -113,7 +171,7 @@ def apply(func, named_args):  # pylint: disable=redefined-builtin
     to that type.
   """
   if isinstance(func, six.string_types):
-    func = ApiFunction.lookup(func)
+    func = _Lookup(func)
   return func.apply(named_args)
 
 
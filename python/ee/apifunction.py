@@ -20,6 +20,8 @@ import copy
 import keyword
 import re
 
+import six
+
 from . import computedobject
 from . import data
 from . import deprecation
@@ -151,11 +153,15 @@ class ApiFunction(function.Function):
     if not cls._api:
       signatures = data.getAlgorithms()
       api = {}
+      intern = six.moves.intern
       for name, sig in signatures.items():
-        # Strip type parameters.
-        sig['returns'] = re.sub('<.*>', '', sig['returns'])
+        # Strip type parameters. The type names are drawn from a small fixed
+        # set but repeat across thousands of signatures, so intern them: the
+        # _Promote dispatch probes and type comparisons made on every API
+        # call then short-circuit on pointer identity.
+        sig['returns'] = intern(str(re.sub('<.*>', '', sig['returns'])))
         for arg in sig['args']:
-          arg['type'] = re.sub('<.*>', '', arg['type'])
+          arg['type'] = intern(str(re.sub('<.*>', '', arg['type'])))
         api[name] = cls(name, sig)
       cls._api = api
 
@@ -166,7 +172,8 @@ class ApiFunction(function.Function):
     cls._bound_signatures = set()
 
   @classmethod
-  def importApi(cls, target, prefix, type_name, opt_prepend=None):
+  def importApi(cls, target, prefix, type_name, opt_prepend=None,
+                opt_names=None):
     """Adds all API functions that begin with a given prefix to a target class.
 
     Args:
@@ -177,10 +184,18 @@ class ApiFunction(function.Function):
           those whose first argument doesn't match are bound as static methods.
       opt_prepend: An optional string to prepend to the names of the
           added functions.
+      opt_names: An optional iterable of API function names to consider,
+          instead of scanning all signatures. Callers that import many
+          prefixes can group names by prefix once and avoid an O(classes *
+          signatures) rescan.
     """
     cls.initialize()
     prepend = opt_prepend or ''
-    for name, api_func in cls._api.items():
+    if opt_names is not None:
+      items = [(name, cls._api[name]) for name in opt_names]
+    else:
+      items = cls._api.items()
+    for name, api_func in items:
       parts = name.split('.')
       if len(parts) == 2 and parts[0] == prefix:
         fname = prepend + parts[1]
@@ -10,13 +10,16 @@ from __future__ import print_function
 
 # pylint: disable=g-bad-import-order
 import contextlib
+import hashlib
 import json
+import os
 import threading
 import time
 import uuid
 
 import httplib2
 import six
+from six.moves import cPickle as pickle
 
 from . import _cloud_api_utils
 from . import deprecation
@@ -631,9 +634,35 @@ def makeTableDownloadUrl(downloadId):
       _tile_base_url, downloadId['docid'], downloadId['token'])
 
 
+# The version of the on-disk algorithms cache format. Bump to invalidate
+# caches written by older versions of this module.
+_ALGORITHMS_CACHE_VERSION = 1
+
+
+def _getAlgorithmsCachePath():
+  """Returns the on-disk cache path for the algorithms listing, or None.
+
+  The cache is opt-in: it is only active when the
+  EARTHENGINE_ALGORITHMS_CACHE_DIR environment variable names a directory.
+  The file name is keyed on the API base URL, so caches for different servers
+  don't share entries.
+  """
+  cache_dir = os.environ.get('EARTHENGINE_ALGORITHMS_CACHE_DIR')
+  if not cache_dir:
+    return None
+  url_hash = hashlib.sha1(
+      (_api_base_url or 'default').encode('utf-8')).hexdigest()[:12]
+  return os.path.join(cache_dir, 'algorithms-%s.pkl' % url_hash)
+
+
 def getAlgorithms():
   """Get the list of algorithms.
 
+  If the EARTHENGINE_ALGORITHMS_CACHE_DIR environment variable names a
+  directory, the listing is pickled there keyed on the server URL and reused
+  by later processes, skipping the network round trip. Algorithm signatures
+  change rarely for a given server; delete the cache file to force a refresh.
+
   Returns:
     The dictionary of algorithms.  Each algorithm is a dictionary containing
     the following fields:
@@ -647,7 +676,24 @@ def getAlgorithms():
             "default" - A representation of the default value if the argument
                 is not specified.
   """
-  return send_('/algorithms', {}, 'GET')
+  cache_path = _getAlgorithmsCachePath()
+  if cache_path and os.path.isfile(cache_path):
+    try:
+      with open(cache_path, 'rb') as f:
+        version, algorithms = pickle.load(f)
+      if version == _ALGORITHMS_CACHE_VERSION:
+        return algorithms
+    except (IOError, OSError, EOFError, ValueError, pickle.UnpicklingError):
+      pass  # An unreadable or stale cache; fall through to a fresh fetch.
+  algorithms = send_('/algorithms', {}, 'GET')
+  if cache_path:
+    try:
+      with open(cache_path, 'wb') as f:
+        pickle.dump((_ALGORITHMS_CACHE_VERSION, algorithms), f,
+                    pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError):
+      pass  # Caching is best-effort.
+  return algorithms
 
 
 def createAsset(value, opt_path=None, opt_force=False, opt_properties=None):
@@ -17,6 +17,10 @@ from . import computedobject
 # A dictionary of the classes in the ee module.  Set by registerClasses.
 _registered_classes = {}
 
+# An optional zero-argument callable that builds any lazily-initialized
+# classes before a failed lookup is retried.  Set by the ee module.
+_class_builder = None
+
 
 def _registerClasses(classes):
   """Registers the known classes.
@@ -28,6 +32,17 @@ def _registerClasses(classes):
   _registered_classes = classes
 
 
+def _registerClassBuilder(builder):
+  """Registers a callable invoked when a class name is not found.
+
+  Args:
+    builder: A zero-argument callable that builds any lazily-initialized
+        classes, after which the lookup is retried.
+  """
+  global _class_builder
+  _class_builder = builder
+
+
 def classToName(klass):
   """Converts a class to the API-friendly type name.
 
@@ -60,7 +75,13 @@ def nameToClass(name):
   Returns:
     The named class.
   """
-  return _registered_classes.get(name)
+  cls = _registered_classes.get(name)
+  if cls is None and _class_builder is not None:
+    # The name may be a dynamically generated class whose construction has
+    # been deferred; build and retry.
+    _class_builder()
+    cls = _registered_classes.get(name)
+  return cls
 
 
 def isSubtype(firstType, secondType):
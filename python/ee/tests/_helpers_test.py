@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 
 
+import os
+import shutil
+import tempfile
+
+import mock
+import oauth2client.service_account
 import six
 
 import unittest
 import ee
+from ee import _helpers
 from ee import apitestcase
 from ee import deserializer
 from ee.apifunction import ApiFunction
@@ -37,5 +44,107 @@ class ProfilingTest(apitestcase.ApiTestCase):
       self.assertEqual('hooked=True getProfiles=False', ee.Number(1).getInfo())
 
 
+class CallCacheTest(apitestcase.ApiTestCase):
+
+  def testCallReusesCachedLookup(self):
+    first = _helpers._Lookup('Image.constant')
+    with mock.patch.object(ApiFunction, 'lookup') as lookup:
+      second = _helpers._Lookup('Image.constant')
+    self.assertFalse(lookup.called)
+    self.assertIs(first, second)
+    # call() and apply() resolve names through the cache.
+    self.assertEqual(
+        ee.call('Image.constant', 1), ee.apply('Image.constant', {'value': 1}))
+
+  def testResetClearsLookupCache(self):
+    _helpers._Lookup('Image.constant')
+    self.assertIn('Image.constant', _helpers._lookup_cache)
+    ee.Reset()
+    self.assertEqual({}, _helpers._lookup_cache)
+
+
+class KeyFileCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    _helpers._keyfile_cache.clear()
+    self.key_dir = tempfile.mkdtemp()
+    self.key_file = os.path.join(self.key_dir, 'key.pem')
+    with open(self.key_file, 'wb') as f:
+      f.write(b'key one')
+
+  def tearDown(self):
+    shutil.rmtree(self.key_dir)
+
+  def testReadKeyFileCaches(self):
+    first = _helpers._ReadKeyFile(self.key_file)
+    second = _helpers._ReadKeyFile(self.key_file)
+    self.assertEqual(b'key one', first)
+    self.assertIs(first, second)
+
+  def testReadKeyFilePicksUpRotation(self):
+    _helpers._ReadKeyFile(self.key_file)
+    with open(self.key_file, 'wb') as f:
+      f.write(b'key two')
+    # Force a different mtime in case the rewrite was within the filesystem's
+    # timestamp granularity.
+    stat = os.stat(self.key_file)
+    os.utime(self.key_file, (stat.st_atime, stat.st_mtime + 10))
+    self.assertEqual(b'key two', _helpers._ReadKeyFile(self.key_file))
+
+
+class ServiceAccountCredentialsCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    _helpers._credentials_cache.clear()
+    self.key_dir = tempfile.mkdtemp()
+    self.key_file = self._MakeKeyFile('key.json')
+
+  def tearDown(self):
+    shutil.rmtree(self.key_dir)
+
+  def _MakeKeyFile(self, name):
+    key_file = os.path.join(self.key_dir, name)
+    with open(key_file, 'wb') as f:
+      f.write(b'{}')
+    return key_file
+
+  def testCredentialsReused(self):
+    with mock.patch.object(
+        oauth2client.service_account.ServiceAccountCredentials,
+        'from_json_keyfile_name',
+        return_value=mock.sentinel.credentials) as from_keyfile:
+      first = ee.ServiceAccountCredentials('foo@bar.com', self.key_file)
+      second = ee.ServiceAccountCredentials('foo@bar.com', self.key_file)
+    self.assertEqual(1, from_keyfile.call_count)
+    self.assertIs(first, second)
+
+  def testCredentialsNotSharedAcrossKeys(self):
+    other_key_file = self._MakeKeyFile('other.json')
+    with mock.patch.object(
+        oauth2client.service_account.ServiceAccountCredentials,
+        'from_json_keyfile_name',
+        side_effect=[mock.sentinel.first, mock.sentinel.second]) as from_keyfile:
+      first = ee.ServiceAccountCredentials('foo@bar.com', self.key_file)
+      second = ee.ServiceAccountCredentials('foo@bar.com', other_key_file)
+    self.assertEqual(2, from_keyfile.call_count)
+    self.assertIsNot(first, second)
+
+  def testCredentialsPickUpKeyRotation(self):
+    with mock.patch.object(
+        oauth2client.service_account.ServiceAccountCredentials,
+        'from_json_keyfile_name',
+        side_effect=[mock.sentinel.first, mock.sentinel.second]) as from_keyfile:
+      first = ee.ServiceAccountCredentials('foo@bar.com', self.key_file)
+      # Rewrite the key file, forcing a different mtime in case the rewrite
+      # was within the filesystem's timestamp granularity.
+      with open(self.key_file, 'wb') as f:
+        f.write(b'{"rotated": true}')
+      stat = os.stat(self.key_file)
+      os.utime(self.key_file, (stat.st_atime, stat.st_mtime + 10))
+      second = ee.ServiceAccountCredentials('foo@bar.com', self.key_file)
+    self.assertEqual(2, from_keyfile.call_count)
+    self.assertIsNot(first, second)
+
+
 if __name__ == '__main__':
   unittest.main()
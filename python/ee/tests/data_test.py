@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 
 
+import os
+import shutil
+import tempfile
+
 import httplib2
 import mock
+from six.moves import cPickle as pickle
 from six.moves import urllib
 import unittest
 import ee
@@ -181,6 +186,62 @@ def DoProfileStubHttp(test, expect_profiling):
 
 
 
+class AlgorithmsCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.cache_dir = tempfile.mkdtemp()
+    self.env = mock.patch.dict(
+        'os.environ', {'EARTHENGINE_ALGORITHMS_CACHE_DIR': self.cache_dir})
+    self.env.start()
+
+  def tearDown(self):
+    self.env.stop()
+    shutil.rmtree(self.cache_dir)
+
+  def testCacheMissFetchesAndWrites(self):
+    with mock.patch.object(
+        ee.data, 'send_', return_value={'fake': 'algorithms'}) as send:
+      self.assertEqual({'fake': 'algorithms'}, ee.data.getAlgorithms())
+    self.assertEqual(1, send.call_count)
+    cache_path = ee.data._getAlgorithmsCachePath()
+    self.assertTrue(os.path.isfile(cache_path))
+
+  def testCacheHitSkipsFetch(self):
+    with mock.patch.object(
+        ee.data, 'send_', return_value={'fake': 'algorithms'}) as send:
+      ee.data.getAlgorithms()
+      self.assertEqual({'fake': 'algorithms'}, ee.data.getAlgorithms())
+    self.assertEqual(1, send.call_count)
+
+  def testVersionMismatchRefetches(self):
+    with open(ee.data._getAlgorithmsCachePath(), 'wb') as f:
+      pickle.dump((-1, {'stale': 'algorithms'}), f)
+    with mock.patch.object(
+        ee.data, 'send_', return_value={'fresh': 'algorithms'}) as send:
+      self.assertEqual({'fresh': 'algorithms'}, ee.data.getAlgorithms())
+    self.assertEqual(1, send.call_count)
+
+  def testCorruptCacheRefetches(self):
+    with open(ee.data._getAlgorithmsCachePath(), 'wb') as f:
+      f.write(b'not a pickle')
+    with mock.patch.object(
+        ee.data, 'send_', return_value={'fresh': 'algorithms'}) as send:
+      self.assertEqual({'fresh': 'algorithms'}, ee.data.getAlgorithms())
+    self.assertEqual(1, send.call_count)
+
+  def testCacheDisabledWithoutEnvironmentVariable(self):
+    self.env.stop()
+    try:
+      self.assertIsNone(ee.data._getAlgorithmsCachePath())
+      with mock.patch.object(
+          ee.data, 'send_', return_value={'fake': 'algorithms'}) as send:
+        ee.data.getAlgorithms()
+        ee.data.getAlgorithms()
+      self.assertEqual(2, send.call_count)
+    finally:
+      self.env.start()
+
+
 class ExceptionForTest(Exception):
   pass
 
@@ -3,6 +3,8 @@
 
 
 
+import collections
+
 import six
 
 import unittest
@@ -323,6 +325,18 @@ class EETestCase(apitestcase.ApiTestCase):
     self.assertTrue(isinstance(ee._Promote(untyped, 'Element'), ee.Element))
     self.assertEqual('foo', ee._Promote(untyped, 'Element').varName)
 
+  def testTypedVariablesAfterInitialize(self):
+    """Verifies CustomFunction.variable is typed right after Initialize."""
+    self.InitializeApi()
+
+    # A statically known class must be registered without any other API use.
+    variable = ee.CustomFunction.variable('Image', 'foo')
+    self.assertTrue(isinstance(variable, ee.Image))
+
+    # A dynamically generated class must trigger the deferred class build.
+    variable = ee.CustomFunction.variable('Projection', 'bar')
+    self.assertTrue(isinstance(variable, ee.Projection))
+
   def testUnboundMethods(self):
     """Verifies unbound method attachment to ee.Algorithms."""
 
@@ -366,6 +380,33 @@ class EETestCase(apitestcase.ApiTestCase):
     self.assertEqual(ee.call('Foo.bar'), ee.Algorithms.Foo.bar())
     self.assertNotEqual(ee.Algorithms.Foo.bar(), ee.Algorithms.last())
 
+  def testUnboundMethodAttachmentOrder(self):
+    """Verifies deep algorithm names survive any attachment order."""
+
+    signature = {
+        'type': 'Algorithm',
+        'args': [],
+        'description': '',
+        'returns': 'Object'
+    }
+
+    def MockSend(path, unused_params, unused_method=None, unused_raw=None):
+      if path == '/algorithms':
+        # A parent arriving between its grandchild and its child must not
+        # drop descendants that were attached first.
+        return collections.OrderedDict([
+            ('Foo', signature),
+            ('Foo.bar.baz', signature),
+            ('Foo.bar', signature),
+        ])
+    ee.data.send_ = MockSend
+
+    ee._InitializeUnboundMethods()
+
+    self.assertTrue(callable(ee.Algorithms.Foo))
+    self.assertTrue(callable(ee.Algorithms.Foo.bar))
+    self.assertTrue(callable(ee.Algorithms.Foo.bar.baz))
+
   def testNonAsciiDocumentation(self):
     """Verifies that non-ASCII characters in documentation work."""
     foo = u'\uFB00\u00F6\u01EB'